@@ -7,6 +7,14 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     MONGODB_URL: str = "mongodb://localhost:27017/"
     DATABASE_NAME: str = "master_database"
+
+    # MongoDB connection pool tuning
+    MONGODB_MAX_POOL_SIZE: int = 200
+    MONGODB_MIN_POOL_SIZE: int = 10
+    MONGODB_MAX_IDLE_TIME_MS: int = 300000
+    MONGODB_SERVER_SELECTION_TIMEOUT_MS: int = 2000
+    MONGODB_CONNECT_TIMEOUT_MS: int = 2000
+    MONGODB_SOCKET_TIMEOUT_MS: int = 5000
     
     # JWT Configuration
     SECRET_KEY: str = "dev-secret-key-change-in-production-abc123xyz"
@@ -16,6 +24,7 @@ class Settings(BaseSettings):
     # Application settings
     APP_NAME: str = "Organization Management Service"
     DEBUG: bool = True
+    HEALTH_CHECK_INTERVAL_SECONDS: int = 10
     
     class Config:
         env_file = ".env"
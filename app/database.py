@@ -1,5 +1,5 @@
 
-from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import ConnectionFailure
 from app.config import settings
 import logging
@@ -8,26 +8,54 @@ logger = logging.getLogger(__name__)
 
 class MongoDB:
     client = None
-    
+
+    @classmethod
+    def _create_client(cls):
+        """Build the Motor client with the configured pool settings"""
+        return AsyncIOMotorClient(
+            settings.MONGODB_URL,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGODB_MAX_IDLE_TIME_MS,
+            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+            connectTimeoutMS=settings.MONGODB_CONNECT_TIMEOUT_MS,
+            socketTimeoutMS=settings.MONGODB_SOCKET_TIMEOUT_MS,
+            retryWrites=True
+        )
+
     @classmethod
-    def connect(cls):
+    async def connect(cls):
         """Establish connection to MongoDB"""
         try:
-            cls.client = MongoClient(settings.MONGODB_URL)
+            cls.client = cls._create_client()
             # Test the connection
-            cls.client.admin.command('ping')
+            await cls.client.admin.command('ping')
             logger.info("Successfully connected to MongoDB")
+            await cls._ensure_indexes()
         except ConnectionFailure as e:
             logger.error(f"Failed to connect to MongoDB: {e}")
             raise
-    
+
+    @classmethod
+    async def _ensure_indexes(cls):
+        """Create indexes on the master organizations collection"""
+        db = cls.client[settings.DATABASE_NAME]
+        # Every lookup in the services goes through one of these two fields;
+        # unique indexes turn the collection scans into B-tree lookups and
+        # enforce the no-duplicate rules at the database level
+        await db["organizations"].create_index("organization_name", unique=True)
+        await db["organizations"].create_index("admin_email", unique=True)
+        logger.info("Ensured indexes on organizations collection")
+
     @classmethod
     def get_database(cls):
         """Get master database instance"""
         if cls.client is None:
-            cls.connect()
+            # Motor connects lazily, so building the client here is safe;
+            # the startup connect() still does the explicit ping and indexes
+            cls.client = cls._create_client()
         return cls.client[settings.DATABASE_NAME]
-    
+
     @classmethod
     def close(cls):
         """Close database connection"""
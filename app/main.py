@@ -1,7 +1,9 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from app.config import settings
@@ -15,6 +17,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Cached health status, refreshed by a background ping loop so that
+# liveness/readiness probes never wait on a database round-trip
+_health_status = {"status": "starting", "database": "unknown"}
+
+async def _health_ping_loop():
+    """Ping MongoDB periodically and cache the result for /health"""
+    while True:
+        try:
+            db = MongoDB.get_database()
+            await db.command('ping')
+            _health_status.update(status="healthy", database="connected")
+            _health_status.pop("error", None)
+        except Exception as e:
+            logger.error(f"Background health ping failed: {e}")
+            _health_status.update(status="unhealthy", database="disconnected", error=str(e))
+        await asyncio.sleep(settings.HEALTH_CHECK_INTERVAL_SECONDS)
+
 # Lifespan context manager for startup/shutdown events
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,11 +42,13 @@ async def lifespan(app: FastAPI):
     """
     # Startup
     logger.info("Starting Organization Management Service...")
-    MongoDB.connect()
+    await MongoDB.connect()
     logger.info("Database connection established")
+    health_task = asyncio.create_task(_health_ping_loop())
     yield
     # Shutdown
     logger.info("Shutting down...")
+    health_task.cancel()
     MongoDB.close()
     logger.info("Database connection closed")
 
@@ -38,7 +59,8 @@ app = FastAPI(
     version="1.0.0",
     lifespan=lifespan,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware configuration
@@ -68,22 +90,9 @@ async def root():
 # Health check endpoint
 @app.get("/health", tags=["Health"])
 async def health_check():
-    
-    try:
-        # Test database connection
-        db = MongoDB.get_database()
-        db.command('ping')
-        return {
-            "status": "healthy",
-            "database": "connected"
-        }
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "error": str(e)
-        }
+
+    # Served from the background ping loop's cache - no database round-trip
+    return dict(_health_status)
 
 if __name__ == "__main__":
     import uvicorn
@@ -91,5 +100,11 @@ if __name__ == "__main__":
         "app.main:app",
         host="0.0.0.0",
         port=8000,
+        # uvloop and httptools ship with uvicorn[standard]; "auto" picks
+        # them wherever they install (uvloop has no Windows build). The
+        # access log costs a logging call per request on the hot path
+        loop="auto",
+        http="auto",
+        access_log=False,
         reload=settings.DEBUG
     )
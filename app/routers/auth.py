@@ -1,7 +1,7 @@
 
 from fastapi import APIRouter, Depends
 from app.models.schemas import AdminLogin, TokenResponse
-from app.services.auth_service import AuthService
+from app.services.auth_service import AuthService, get_auth_service
 
 router = APIRouter(
     prefix="/admin",
@@ -9,7 +9,9 @@ router = APIRouter(
 )
 
 @router.post("/login", response_model=TokenResponse)
-async def admin_login(login_data: AdminLogin):
-   
-    auth_service = AuthService()
-    return auth_service.authenticate_admin(login_data)
+async def admin_login(
+    login_data: AdminLogin,
+    auth_service: AuthService = Depends(get_auth_service)
+):
+
+    return await auth_service.authenticate_admin(login_data)
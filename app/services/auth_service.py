@@ -1,26 +1,59 @@
 
 from fastapi import HTTPException, status
+from cachetools import TTLCache
 from app.database import get_organizations_collection
 from app.utils.security import verify_password
 from app.utils.jwt_handler import create_access_token
 from app.models.schemas import AdminLogin, TokenResponse
+import hashlib
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache of successfully validated credentials, keyed by a
+# SHA-256 of email:password. A hit skips both the Mongo lookup and the
+# Argon2 verify under login storms; failed logins are never cached.
+_login_cache = TTLCache(maxsize=5000, ttl=10)
+
 class AuthService:
-  
-    
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "AuthService":
+        """Return the shared service instance, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         self.orgs_collection = get_organizations_collection()
     
-    def authenticate_admin(self, login_data: AdminLogin) -> TokenResponse:
-  
+    async def authenticate_admin(self, login_data: AdminLogin) -> TokenResponse:
+
         logger.info(f"Authentication attempt for email: {login_data.email}")
-        
-        # Find organization by admin email
-        organization = self.orgs_collection.find_one(
-            {"admin_email": login_data.email}
+
+        cache_key = hashlib.sha256(
+            f"{login_data.email}:{login_data.password}".encode()
+        ).hexdigest()
+
+        # Recently validated credentials skip the lookup and password verify
+        cached = _login_cache.get(cache_key)
+        if cached is not None:
+            access_token = create_access_token(cached)
+            logger.info(f"Login successful for {login_data.email} (cached credentials)")
+            return TokenResponse(
+                access_token=access_token,
+                token_type="bearer",
+                organization_name=cached["organization_name"],
+                admin_email=cached["email"]
+            )
+
+        # Find organization by admin email, fetching only the fields the
+        # token needs
+        organization = await self.orgs_collection.find_one(
+            {"admin_email": login_data.email},
+            {"_id": 1, "admin_email": 1, "admin_password": 1, "organization_name": 1}
         )
         
         if not organization:
@@ -46,7 +79,10 @@ class AuthService:
         }
         
         access_token = create_access_token(token_data)
-        
+
+        # Cache only after the password verified successfully
+        _login_cache[cache_key] = token_data
+
         logger.info(f"Login successful for {login_data.email}")
         
         return TokenResponse(
@@ -55,3 +91,7 @@ class AuthService:
             organization_name=organization["organization_name"],
             admin_email=organization["admin_email"]
         )
+
+# Dependency provider for FastAPI routes
+def get_auth_service() -> AuthService:
+    return AuthService.instance()
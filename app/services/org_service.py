@@ -1,5 +1,7 @@
 
 from fastapi import HTTPException, status
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from app.config import settings
 from app.database import get_organizations_collection, get_org_collection, MongoDB
 from app.utils.security import hash_password
 from app.models.schemas import (
@@ -8,74 +10,74 @@ from app.models.schemas import (
     OrganizationResponse,
     MessageResponse
 )
-from datetime import datetime
+from cachetools import TTLCache
+from datetime import datetime, timezone
 from bson import ObjectId
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Organization metadata changes rarely relative to how often it is read,
+# so cache name lookups for a short window. Write paths pop the affected
+# keys; passwords are never stored here.
+_org_by_name = TTLCache(maxsize=10000, ttl=30)
+
 class OrganizationService:
 
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> "OrganizationService":
+        """Return the shared service instance, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         self.orgs_collection = get_organizations_collection()
         self.db = MongoDB.get_database()
     
-    def create_organization(self, org_data: OrganizationCreate) -> OrganizationResponse:
+    async def create_organization(self, org_data: OrganizationCreate) -> OrganizationResponse:
 
         logger.info(f"Creating organization: {org_data.organization_name}")
-        
-        # Check if organization name already exists
-        existing_org = self.orgs_collection.find_one(
-            {"organization_name": org_data.organization_name}
-        )
-        
-        if existing_org:
-            logger.warning(f"Organization already exists: {org_data.organization_name}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Organization '{org_data.organization_name}' already exists"
-            )
-        
-        # Check if admin email already exists
-        existing_email = self.orgs_collection.find_one(
-            {"admin_email": org_data.email}
-        )
-        
-        if existing_email:
-            logger.warning(f"Email already registered: {org_data.email}")
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="This email is already registered with another organization"
-            )
-        
-        # Get or create organization-specific collection
-        org_collection, collection_name = get_org_collection(org_data.organization_name)
+
+        # Resolve the organization-specific collection name; Mongo creates
+        # the collection itself on first write
+        _, collection_name = get_org_collection(org_data.organization_name)
         
         # Hash the admin password
         hashed_password = hash_password(org_data.password)
         
-        # Prepare organization document
+        # Prepare organization document; capture the timestamp once so
+        # created_at and updated_at start out identical
+        now = datetime.now(timezone.utc)
         org_document = {
             "organization_name": org_data.organization_name,
             "collection_name": collection_name,
             "admin_email": org_data.email,
             "admin_password": hashed_password,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
         
-        # Insert into master database
-        result = self.orgs_collection.insert_one(org_document)
-        
-        # Explicitly create the collection (good practice)
-        # This ensures the collection exists even if empty
+        # Insert into master database; the unique indexes enforce both
+        # no-duplicate rules in the same round-trip as the insert
         try:
-            self.db.create_collection(collection_name)
-            logger.info(f"Created collection: {collection_name}")
-        except Exception as e:
-            # Collection might already exist, which is fine
-            logger.info(f"Collection {collection_name} already exists or created implicitly")
-        
+            result = await self.orgs_collection.insert_one(org_document)
+        except DuplicateKeyError as e:
+            key_pattern = (e.details or {}).get("keyPattern", {})
+            if "admin_email" in key_pattern:
+                logger.warning(f"Email already registered: {org_data.email}")
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="This email is already registered with another organization"
+                )
+            logger.warning(f"Organization already exists: {org_data.organization_name}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Organization '{org_data.organization_name}' already exists"
+            )
+
         logger.info(f"Organization created successfully: {org_data.organization_name}")
         
         return OrganizationResponse(
@@ -85,22 +87,27 @@ class OrganizationService:
             created_at=org_document["created_at"]
         )
     
-    def get_organization(self, organization_name: str) -> OrganizationResponse:
+    async def get_organization(self, organization_name: str) -> OrganizationResponse:
 
         logger.info(f"Fetching organization: {organization_name}")
-        
-        organization = self.orgs_collection.find_one(
-            {"organization_name": organization_name},
-            {"admin_password": 0}  # Exclude password from response
-        )
-        
+
+        organization = _org_by_name.get(organization_name)
+
+        if organization is None:
+            organization = await self.orgs_collection.find_one(
+                {"organization_name": organization_name},
+                {"admin_password": 0}  # Exclude password from response
+            )
+            if organization:
+                _org_by_name[organization_name] = organization
+
         if not organization:
             logger.warning(f"Organization not found: {organization_name}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Organization '{organization_name}' not found"
             )
-        
+
         return OrganizationResponse(
             organization_name=organization["organization_name"],
             collection_name=organization["collection_name"],
@@ -108,35 +115,39 @@ class OrganizationService:
             created_at=organization.get("created_at")
         )
     
-    def update_organization(self, org_data: OrganizationUpdate, token_data: dict) -> MessageResponse:
+    async def update_organization(self, org_data: OrganizationUpdate, token_data: dict) -> MessageResponse:
      
         logger.info(f"Updating organization for email: {org_data.email}")
-        
-        # Find existing organization by admin email
-        existing_org = self.orgs_collection.find_one(
-            {"admin_email": org_data.email}
+
+        # Ownership is a pure string compare against the token - no
+        # database round-trip needed
+        if org_data.email != token_data["email"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You are not authorized to update this organization"
+            )
+
+        # Find existing organization by admin email, fetching only the
+        # fields the update needs
+        existing_org = await self.orgs_collection.find_one(
+            {"admin_email": org_data.email},
+            {"_id": 1, "organization_name": 1, "collection_name": 1}
         )
-        
+
         if not existing_org:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Organization not found for this email"
             )
-        
-        # Verify the requesting user owns this organization
-        if existing_org["admin_email"] != token_data["email"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not authorized to update this organization"
-            )
-        
+
         old_collection_name = existing_org["collection_name"]
         old_org_name = existing_org["organization_name"]
         
         # Check if new organization name already exists (if different)
         if org_data.organization_name != old_org_name:
-            duplicate_check = self.orgs_collection.find_one(
-                {"organization_name": org_data.organization_name}
+            duplicate_check = await self.orgs_collection.find_one(
+                {"organization_name": org_data.organization_name},
+                {"_id": 1}  # Existence check only
             )
             if duplicate_check:
                 raise HTTPException(
@@ -145,37 +156,60 @@ class OrganizationService:
                 )
         
         # Get new collection reference
-        new_collection, new_collection_name = get_org_collection(org_data.organization_name)
+        _, new_collection_name = get_org_collection(org_data.organization_name)
         old_collection = self.db[old_collection_name]
         
         # Migrate data if collection name changed
         if old_collection_name != new_collection_name:
             logger.info(f"Migrating data from {old_collection_name} to {new_collection_name}")
-            
-            # Copy all documents from old to new collection
-            document_count = old_collection.count_documents({})
-            if document_count > 0:
-                documents = list(old_collection.find({}))
-                new_collection.insert_many(documents)
-                logger.info(f"Migrated {document_count} documents")
-            
-            # Drop old collection
-            old_collection.drop()
-            logger.info(f"Dropped old collection: {old_collection_name}")
+
+            try:
+                # Same-database rename is an O(1) catalog update - no data moves
+                await self.db.client.admin.command(
+                    'renameCollection',
+                    f'{settings.DATABASE_NAME}.{old_collection_name}',
+                    to=f'{settings.DATABASE_NAME}.{new_collection_name}'
+                )
+                logger.info(f"Renamed collection {old_collection_name} to {new_collection_name}")
+            except OperationFailure as e:
+                # Rename can be denied (e.g. missing privileges on admin);
+                # fall back to a server-side $out copy - documents still
+                # never leave Mongo, and the cursor must be iterated for
+                # the pipeline to run
+                logger.warning(f"renameCollection failed ({e}), falling back to $out copy")
+                await old_collection.aggregate(
+                    [{"$match": {}}, {"$out": new_collection_name}],
+                    allowDiskUse=True
+                ).to_list(length=None)
+                await old_collection.drop()
+                logger.info(f"Dropped old collection: {old_collection_name}")
         
         # Update organization metadata
         update_data = {
             "organization_name": org_data.organization_name,
             "collection_name": new_collection_name,
             "admin_password": hash_password(org_data.password),
-            "updated_at": datetime.utcnow()
+            "updated_at": datetime.now(timezone.utc)
         }
         
-        self.orgs_collection.update_one(
-            {"_id": existing_org["_id"]},
-            {"$set": update_data}
+        # Keep ownership in the filter so a concurrent delete or admin
+        # change between the lookup and this write can't be overwritten
+        updated = await self.orgs_collection.find_one_and_update(
+            {"_id": existing_org["_id"], "admin_email": token_data["email"]},
+            {"$set": update_data},
+            projection={"_id": 1}
         )
-        
+
+        if updated is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Organization not found for this email"
+            )
+
+        # Drop cached copies under both the old and the new name
+        _org_by_name.pop(old_org_name, None)
+        _org_by_name.pop(org_data.organization_name, None)
+
         logger.info(f"Organization updated successfully: {org_data.organization_name}")
         
         return MessageResponse(
@@ -188,37 +222,41 @@ class OrganizationService:
             }
         )
     
-    def delete_organization(self, organization_name: str, token_data: dict) -> MessageResponse:
+    async def delete_organization(self, organization_name: str, token_data: dict) -> MessageResponse:
 
         logger.info(f"Deleting organization: {organization_name}")
-        
-        # Find the organization
-        organization = self.orgs_collection.find_one(
-            {"organization_name": organization_name}
+
+        # Fetch, ownership-check, and delete in one atomic round-trip -
+        # the filter only matches if the caller's email owns this org
+        organization = await self.orgs_collection.find_one_and_delete(
+            {"organization_name": organization_name, "admin_email": token_data["email"]},
+            projection={"collection_name": 1}
         )
-        
-        if not organization:
+
+        if organization is None:
+            # Distinguish 404 from 403 only on the failure path
+            exists = await self.orgs_collection.find_one(
+                {"organization_name": organization_name},
+                {"_id": 1}
+            )
+            if exists:
+                logger.warning(f"Unauthorized deletion attempt by {token_data['email']}")
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="You are not authorized to delete this organization"
+                )
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Organization '{organization_name}' not found"
             )
-        
-        # Verify ownership - only the admin of this org can delete it
-        if organization["admin_email"] != token_data["email"]:
-            logger.warning(f"Unauthorized deletion attempt by {token_data['email']}")
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You are not authorized to delete this organization"
-            )
-        
+
         # Drop the organization's collection
         collection_name = organization["collection_name"]
-        self.db[collection_name].drop()
+        await self.db[collection_name].drop()
         logger.info(f"Dropped collection: {collection_name}")
-        
-        # Delete organization from master database
-        self.orgs_collection.delete_one({"_id": organization["_id"]})
-        
+
+        _org_by_name.pop(organization_name, None)
+
         logger.info(f"Organization deleted successfully: {organization_name}")
         
         return MessageResponse(
@@ -228,3 +266,7 @@ class OrganizationService:
                 "collection_deleted": collection_name
             }
         )
+
+# Dependency provider for FastAPI routes
+def get_org_service() -> OrganizationService:
+    return OrganizationService.instance()
@@ -1,13 +1,24 @@
 
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError
 from datetime import datetime, timedelta
 from fastapi import HTTPException, status, Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from cachetools import TTLCache
 from app.config import settings
 from typing import Dict
+import hashlib
+import threading
+import time
 
 security = HTTPBearer()
 
+# Cache of successfully verified tokens, keyed by SHA-256 of the raw token.
+# Skips the HMAC verification for repeated requests with the same bearer token.
+# Only valid payloads are cached; failed decodes always go through jwt.decode.
+_token_cache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
 def create_access_token(data: Dict[str, str]) -> str:
 
     to_encode = data.copy()
@@ -23,25 +34,40 @@ def create_access_token(data: Dict[str, str]) -> str:
 
 def verify_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> Dict[str, str]:
 
+    cache_key = hashlib.sha256(credentials.credentials.encode()).hexdigest()
+
+    # Check the cache first - a hit skips the signature verification entirely
+    with _token_cache_lock:
+        cached_payload = _token_cache.get(cache_key)
+
+    if cached_payload is not None and cached_payload.get("exp", 0) > time.time():
+        return cached_payload
+
     try:
         payload = jwt.decode(
-            credentials.credentials, 
-            settings.SECRET_KEY, 
+            credentials.credentials,
+            settings.SECRET_KEY,
             algorithms=[settings.ALGORITHM]
         )
-        
+
         email: str = payload.get("email")
         org_id: str = payload.get("org_id")
-        
+
         if email is None or org_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload"
             )
-        
+
+        # Cache the verified payload; the exp check above keeps an entry that
+        # outlives its token from ever being served
+        if payload.get("exp", 0) > time.time():
+            with _token_cache_lock:
+                _token_cache[cache_key] = payload
+
         return payload
-    
-    except JWTError:
+
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
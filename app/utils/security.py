@@ -1,8 +1,15 @@
 
 from passlib.context import CryptContext
 
-# Configure bcrypt for password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Argon2id for password hashing (RFC 9106 low-memory parameters); bcrypt
+# stays registered so hashes created before the switch keep verifying
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1
+)
 
 def hash_password(password: str) -> str:
   